@@ -1,6 +1,7 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 from __future__ import print_function, unicode_literals
+import io
 import os
 
 from setuptools import find_packages, setup
@@ -9,8 +10,8 @@ from subui import __author__, __description__, __version__
 
 
 def read(fname):
-    with open(os.path.abspath(os.path.join(__file__, os.pardir, fname)), 'rb') as fid:
-        return fid.read().decode('utf-8')
+    with io.open(os.path.abspath(os.path.join(__file__, os.pardir, fname)), encoding='utf-8') as fid:
+        return fid.read()
 
 
 authors = read('AUTHORS.rst')
@@ -18,12 +19,14 @@ history = read('HISTORY.rst').replace('.. :changelog:', '')
 licence = read('LICENSE.rst')
 readme = read('README.rst')
 
-requirements = read('requirements.txt').splitlines() + [
+base_requirements = read('requirements.txt').splitlines()
+
+requirements = base_requirements + [
     'setuptools',
 ]
 
 test_requirements = (
-    read('requirements.txt').splitlines() +
+    base_requirements +
     read('requirements-dev.txt').splitlines()[1:]
 )
 
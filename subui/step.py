@@ -1,16 +1,20 @@
 from __future__ import print_function, unicode_literals
-import inspect
 import sys
 import unittest
 from collections import OrderedDict
 
 import six
+from django.core.exceptions import ImproperlyConfigured
 from django.core.urlresolvers import reverse
 from django.test import override_settings
 
 from .validators import BaseValidator
 
 
+# exception classes raised by TestStep.request keyed by original exception class
+_REQUEST_EXCEPTIONS = {}
+
+
 class TestStep(object):
     """
     Test step for :py:class:`subui.test_runner.SubUITestRunner`.
@@ -31,7 +35,9 @@ class TestStep(object):
     :var dict url_kwargs: URL kwargs to be used while calculating
         the URL using Django's ``reverse``.
     :var str request_method: HTTP method to use for the request.
-        Default is ``"post"``
+        Default is ``"post"``. The matching client method
+        is looked up once when the step is initialized
+        with :py:meth:`init`.
     :var str urlconf: Django URL Configuration.
     :var str content_type: Content-Type of the request.
     :var dict overriden_settings: Dictionary of settings to be overriden for the
@@ -50,6 +56,18 @@ class TestStep(object):
         and manually instantiating step instance.
     :type kwargs: dict
     """
+    # runtime attributes set for every step by the runner are stored in
+    # slots while ``__dict__`` is kept for attributes given in ``__init__``
+    __slots__ = (
+        'client',
+        'steps',
+        'step_index',
+        'step_key',
+        'response',
+        '__dict__',
+        '__weakref__',
+    )
+
     test = unittest.TestCase('__init__')
 
     url_name = None
@@ -66,10 +84,14 @@ class TestStep(object):
 
     validators = []
 
+    _step_items_cache = None
+    _skipped_hooks = frozenset()
+
     def __init__(self, **kwargs):
-        self.__dict__.update(kwargs)
+        for key, value in kwargs.items():
+            setattr(self, key, value)
 
-    def init(self, client, steps, step_index, step_key, state):
+    def init(self, client, steps, step_index, step_key, state, step_items=None):
         """
         Initialize the step with necessary values from the
         test runner.
@@ -93,6 +115,11 @@ class TestStep(object):
 
         :param state: Global state reference from the test runner.
         :type state: platform_utils.utils.dt_context.BaseContext
+
+        :param step_items: Optional precomputed list of ``(key, step)``
+            pairs of all steps. When provided, previous and next steps
+            are sliced from it instead of from ``steps``.
+        :type step_items: list
         """
         self.client = client
         self.steps = steps
@@ -101,6 +128,39 @@ class TestStep(object):
 
         self.state = state
 
+        self._skipped_hooks = frozenset(
+            name for name in _DEFAULT_HOOKS if self._is_default_hook(name)
+        )
+
+        if step_items is not None:
+            self._step_items_cache = (steps, step_items)
+
+    def _is_default_hook(self, name):
+        """
+        Check whether the hook is the default no-op implementation
+        from :py:class:`TestStep` in which case calling it
+        can be skipped.
+
+        :rtype: bool
+        """
+        hook = getattr(self, name)
+        return getattr(hook, '__func__', None) is _DEFAULT_HOOKS[name]
+
+    def _get_step_items(self):
+        """
+        Get list of ``(key, step)`` pairs of all steps.
+
+        The list is computed once from :py:attr:`steps` and is
+        cached until :py:attr:`steps` is replaced with
+        another object.
+
+        :rtype: list
+        """
+        cache = self._step_items_cache
+        if cache is None or cache[0] is not self.steps:
+            cache = self._step_items_cache = (self.steps, list(self.steps.items()))
+        return cache[1]
+
     @property
     def prev_steps(self):
         """
@@ -119,7 +179,7 @@ class TestStep(object):
 
         :rtype: :py:class:`collections.OrderedDict`
         """
-        return OrderedDict(list(self.steps.items())[:self.step_index][::-1])
+        return OrderedDict(reversed(self._get_step_items()[:self.step_index]))
 
     @property
     def next_steps(self):
@@ -129,7 +189,7 @@ class TestStep(object):
 
         :rtype: :py:class:`collections.OrderedDict`
         """
-        return OrderedDict(list(self.steps.items())[self.step_index + 1:])
+        return OrderedDict(self._get_step_items()[self.step_index + 1:])
 
     @property
     def prev_step(self):
@@ -138,18 +198,21 @@ class TestStep(object):
 
         :rtype: :py:class:`TestStep`
         """
-        prev_steps = list(self.prev_steps.values())
-        return prev_steps[0] if prev_steps else None
+        if self.step_index > 0:
+            return self._get_step_items()[self.step_index - 1][1]
+        return None
 
     @property
     def next_step(self):
         """
-        Get previous step instance, if any.
+        Get next step instance, if any.
 
         :rtype: :py:class:`TestStep`
         """
-        next_steps = list(self.next_steps.values())
-        return next_steps[0] if next_steps else None
+        items = self._get_step_items()
+        if self.step_index + 1 < len(items):
+            return items[self.step_index + 1][1]
+        return None
 
     def get_urlconf(self):
         """
@@ -273,6 +336,23 @@ class TestStep(object):
         """
         return self.validators
 
+    def _send_request(self):
+        """
+        Send the request with the :py:attr:`client`
+        using :py:meth:`get_request_kwargs`.
+
+        :returns: server response
+        :raises ImproperlyConfigured: If the :py:attr:`client`
+            does not support :py:attr:`request_method`.
+        """
+        client_call = getattr(self.client, self.request_method, None)
+        if client_call is None:
+            msg = '{} defines request_method {!r} which is not supported by the client'
+            raise ImproperlyConfigured(
+                msg.format(self.__class__.__name__, self.request_method)
+            )
+        return client_call(**self.get_request_kwargs())
+
     def request(self):
         """
         Make the server request. Server response is then saved
@@ -284,27 +364,34 @@ class TestStep(object):
 
         :returns: server response
         """
-        self.pre_request_hook()
+        if 'pre_request_hook' not in self._skipped_hooks:
+            self.pre_request_hook()
         try:
-            with override_settings(**self.get_override_settings()):
-                self.response = (getattr(self.client, self.request_method)
-                                 (**self.get_request_kwargs()))
+            overriden_settings = self.get_override_settings()
+            if overriden_settings:
+                with override_settings(**overriden_settings):
+                    self.response = self._send_request()
+            else:
+                self.response = self._send_request()
         except Exception:
-            validator = BaseValidator(self)
             e_type, e, e_traceback = sys.exc_info()
 
             msg = ('{} failed:\n\n{}'
-                   ''.format(validator._get_base_error_message(),
+                   ''.format(BaseValidator._format_base_error_message(self),
                              six.text_type(e)))
 
-            cls = type(e_type.__name__, (Exception,), {})
+            cls = _REQUEST_EXCEPTIONS.get(e_type)
+            if cls is None:
+                cls = type(e_type.__name__, (Exception,), {})
+                _REQUEST_EXCEPTIONS[e_type] = cls
             six.reraise(
                 cls,
                 cls(msg),
                 e_traceback
             )
 
-        self.post_request_hook()
+        if 'post_request_hook' not in self._skipped_hooks:
+            self.post_request_hook()
 
         return self.response
 
@@ -317,15 +404,17 @@ class TestStep(object):
         is called and :py:meth:`post_test_response` is called
         after assertions.
         """
-        self.pre_test_response()
+        if 'pre_test_response' not in self._skipped_hooks:
+            self.pre_test_response()
 
         for validator in self.get_validators():
-            if inspect.isclass(validator):
+            if isinstance(validator, type):
                 validator(self).test(self)
             else:
                 validator.test(self)
 
-        self.post_test_response()
+        if 'post_test_response' not in self._skipped_hooks:
+            self.post_test_response()
 
     def pre_test_response(self):
         """
@@ -348,6 +437,17 @@ class TestStep(object):
         """
 
 
+_DEFAULT_HOOKS = {
+    name: TestStep.__dict__[name]
+    for name in (
+        'pre_request_hook',
+        'post_request_hook',
+        'pre_test_response',
+        'post_test_response',
+    )
+}
+
+
 class StatefulUrlParamsTestStep(TestStep):
 
     """
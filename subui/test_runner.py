@@ -1,5 +1,4 @@
 from __future__ import print_function, unicode_literals
-import inspect
 from collections import OrderedDict
 
 from pycontext.context import Context
@@ -21,6 +20,10 @@ class SubUITestRunner(object):
         These kwargs will be provided to each step when executed.
     :var pycontext.context.Context state: State to be
         shared between test step executions.
+    :var type state_class: Class used to construct :py:attr:`state`.
+        By default :py:class:`pycontext.context.Context` is used
+        however can be changed to a lighter mapping such as ``dict``
+        when steps only get and set state keys.
 
     :param steps: Steps to be executed. Executed in the provided order
         hence need to be provided in order-maintaining data-structure.
@@ -37,6 +40,7 @@ class SubUITestRunner(object):
         step during initialization if it is not already provided
         as initialized object.
     """
+    state_class = Context
 
     def __init__(self, steps, client, state=None, **kwargs):
         msg = 'SubUI steps can either be tuple, list or OrderedDict'
@@ -46,7 +50,7 @@ class SubUITestRunner(object):
         self.client = client
         self.kwargs = kwargs
 
-        self.state = Context(state or {})
+        self.state = self.state_class(state or {})
 
         self._normalize_steps()
 
@@ -62,12 +66,17 @@ class SubUITestRunner(object):
         :py:attr:`SubUITestRunner.kwargs` given to runner.
         """
         if isinstance(self.steps, (list, tuple)):
-            self.steps = OrderedDict(zip(range(len(self.steps)), self.steps))
-
-        self.steps = OrderedDict(map(
-            lambda s: (s[0], s[1](**self.kwargs)) if inspect.isclass(s[1]) else s,
-            self.steps.items()
-        ))
+            steps = enumerate(self.steps)
+        elif any(isinstance(step, type) for step in self.steps.values()):
+            steps = self.steps.items()
+        else:
+            # already OrderedDict of step instances
+            return
+
+        self.steps = OrderedDict(
+            (key, step(**self.kwargs) if isinstance(step, type) else step)
+            for key, step in steps
+        )
 
     def run(self):
         """
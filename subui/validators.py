@@ -1,10 +1,36 @@
 from __future__ import print_function, unicode_literals
-import inspect
+from itertools import chain
 
+import six
 from django.core.exceptions import ImproperlyConfigured
 from django.core.urlresolvers import Resolver404, resolve
 from django.template.response import SimpleTemplateResponse
-from six.moves.urllib_parse import urlsplit, urlunsplit
+from django.utils.encoding import force_bytes
+from six.moves.urllib_parse import urlsplit
+
+
+@six.python_2_unicode_compatible
+class _LazyErrorMessage(object):
+    """
+    Assertion error message which is only formatted when it is
+    rendered as a string which normally only happens when
+    the assertion fails.
+
+    The first placeholder of the message is filled with
+    the base error message of the test step the message
+    was created for.
+    """
+
+    def __init__(self, test_step, msg, *args):
+        self.test_step = test_step
+        self.msg = msg
+        self.args = args
+
+    def __str__(self):
+        return self.msg.format(
+            BaseValidator._format_base_error_message(self.test_step),
+            *self.args
+        )
 
 
 class BaseValidator(object):
@@ -12,9 +38,10 @@ class BaseValidator(object):
     Base validator which should be sub-classed to create
     custom validators.
 
-    :var tuple BaseValidator.expected_attrs: Required attributes for the
+    :var frozenset BaseValidator.expected_attrs: Required attributes for the
         validator. :py:meth:`_check_improper_configuration`
         will verify that all of these attributes are defined.
+        Any iterable such as ``tuple`` is accepted as well.
 
         .. note:: Each validator should only define required
             attributes for itself. :py:meth:`_get_expected_attrs`
@@ -32,6 +59,8 @@ class BaseValidator(object):
     """
     expected_attrs = None
 
+    _content_bytes_cache = None
+
     def __init__(self, test_step=None, **kwargs):
         self.step = test_step
         self.__dict__.update(**kwargs)
@@ -52,15 +81,23 @@ class BaseValidator(object):
 
             > validator = Validator2()
             > validator._get_expected_attrs()
-            ['foo', 'bar', 'hello', 'world']
+            ['bar', 'foo', 'hello', 'world']
+
+        .. note:: Attributes are only computed once per validator
+            class and are cached on the class afterwards.
 
         :rtype: list
         """
-        bases = inspect.getmro(self.__class__)
-        attrs = set()
-        for base in bases:
-            attrs |= set(getattr(base, 'expected_attrs', None) or set())
-        return list(sorted(attrs))
+        cls = type(self)
+        attrs = cls.__dict__.get('_resolved_expected_attrs')
+        if attrs is None:
+            attrs = tuple(sorted(set(chain.from_iterable(
+                base.__dict__.get('expected_attrs') or ()
+                for base in cls.__mro__
+            ))))
+            cls._resolved_expected_attrs = attrs
+
+        return list(attrs)
 
     def _check_improper_configuration(self):
         """
@@ -71,25 +108,61 @@ class BaseValidator(object):
         :raises ImproperlyConfigured: If any of the required
             attributes are not defined.
         """
-        for attr in self._get_expected_attrs():
-            if not getattr(self, attr, None):
-                msg = '{} requires to define {}'
-                raise ImproperlyConfigured(
-                    msg.format(self.__class__.__name__, attr)
-                )
+        missing = next((attr for attr in self._get_expected_attrs()
+                        if not getattr(self, attr, None)), None)
+        if missing is not None:
+            msg = '{} requires to define {}'
+            raise ImproperlyConfigured(
+                msg.format(self.__class__.__name__, missing)
+            )
 
-    def _get_base_error_message(self):
+    @staticmethod
+    def _format_base_error_message(test_step):
         """
-        Get base error message which will be used in assertions
+        Get base error message for the given test step
+        without needing a validator instance.
         """
         msg = 'Response for {{{key}:{step}}} requesting "{url}"'
         msg = msg.format(
-            key=self.step.step_key,
-            step=self.step.__class__.__name__,
-            url=self.step.get_url(),
+            key=test_step.step_key,
+            step=test_step.__class__.__name__,
+            url=test_step.get_url(),
         )
         return msg
 
+    def _get_base_error_message(self):
+        """
+        Get base error message which will be used in assertions
+        """
+        return self._format_base_error_message(self.step)
+
+    def _get_content_bytes(self, content):
+        """
+        Get content encoded as UTF-8 bytes to search for
+        in the binary response content.
+
+        Encoded content is cached on the validator so validator
+        instances reused across steps only encode it once.
+
+        :rtype: bytes
+        """
+        cache = self._content_bytes_cache
+        if cache is None or cache[0] != content:
+            cache = self._content_bytes_cache = (content, force_bytes(content))
+        return cache[1]
+
+    def _get_error_message(self, msg, *args):
+        """
+        Get assertion error message which is only formatted
+        when the assertion fails.
+
+        :param msg: Message format string where the first
+            placeholder is the base error message of the
+            current :py:attr:`step`
+        :param args: Remaining format arguments
+        """
+        return _LazyErrorMessage(self.step, msg, *args)
+
     def test(self, test_step):
         """
         Test the step's server response by making
@@ -121,7 +194,7 @@ class HeaderValidator(BaseValidator):
         header value contains another value, or simply
         check equality to that value
     """
-    expected_attrs = ('header_name', 'expected_header',)
+    expected_attrs = frozenset(('header_name', 'expected_header'))
     header_name = None
     expected_header = None
     test_header_value = True
@@ -134,10 +207,16 @@ class HeaderValidator(BaseValidator):
         """
         attrs = super(HeaderValidator, self)._get_expected_attrs()
 
-        if not self.test_header_value:
-            attrs.remove('expected_header')
+        if self.test_header_value:
+            return attrs
+
+        cls = type(self)
+        attrs_without_header = cls.__dict__.get('_resolved_expected_attrs_without_header')
+        if attrs_without_header is None:
+            attrs_without_header = tuple(attr for attr in attrs if attr != 'expected_header')
+            cls._resolved_expected_attrs_without_header = attrs_without_header
 
-        return attrs
+        return list(attrs_without_header)
 
     def test(self, test_step):
         """
@@ -149,35 +228,37 @@ class HeaderValidator(BaseValidator):
         header value will be tested to contain expected value.
         """
         super(HeaderValidator, self).test(test_step)
-        if self.test_contains_value:
-            self.test_header_value = False
         self.step.test.assertIn(
             self.header_name,
             self.step.response,
-            '{} must contain {} header'
-            ''.format(self._get_base_error_message(),
-                      self.header_name)
-        )
-        if self.test_header_value:
-            self.test_contains_value = False
-            self.step.test.assertEqual(
-                self.step.response[self.header_name],
-                self.expected_header,
-                '{} returned header {} with value {} != {}'
-                ''.format(self._get_base_error_message(),
-                          self.header_name,
-                          self.step.response[self.header_name],
-                          self.expected_header)
+            self._get_error_message(
+                '{} must contain {} header',
+                self.header_name,
             )
+        )
         if self.test_contains_value:
+            value = self.step.response[self.header_name]
             self.step.test.assertIn(
                 self.expected_header,
-                self.step.response[self.header_name],
-                '{} returned header {} with value {} which doesnt contain {}'
-                ''.format(self._get_base_error_message(),
-                          self.header_name,
-                          self.step.response[self.header_name],
-                          self.expected_header)
+                value,
+                self._get_error_message(
+                    '{} returned header {} with value {} which doesnt contain {}',
+                    self.header_name,
+                    value,
+                    self.expected_header,
+                )
+            )
+        elif self.test_header_value:
+            value = self.step.response[self.header_name]
+            self.step.test.assertEqual(
+                value,
+                self.expected_header,
+                self._get_error_message(
+                    '{} returned header {} with value {} != {}',
+                    self.header_name,
+                    value,
+                    self.expected_header,
+                )
             )
 
 
@@ -205,7 +286,7 @@ class StatusCodeValidator(BaseValidator):
     :var int StatusCodeValidator.expected_status_code: Expected status code to be
         returned by the server
     """
-    expected_attrs = ('expected_status_code',)
+    expected_attrs = frozenset(('expected_status_code',))
     expected_status_code = None
 
     def test(self, test_step):
@@ -218,10 +299,11 @@ class StatusCodeValidator(BaseValidator):
         self.step.test.assertEqual(
             self.step.response.status_code,
             self.expected_status_code,
-            '{} returned with status code {} != {}'
-            ''.format(self._get_base_error_message(),
-                      self.step.response.status_code,
-                      self.expected_status_code)
+            self._get_error_message(
+                '{} returned with status code {} != {}',
+                self.step.response.status_code,
+                self.expected_status_code,
+            )
         )
 
 
@@ -258,7 +340,7 @@ class RedirectToRouteValidator(StatusCodeRedirectValidator):
     :var str expected_route_name: Route name to which
         the server should redirect to
     """
-    expected_attrs = ('expected_route_name',)
+    expected_attrs = frozenset(('expected_route_name',))
     expected_route_name = None
 
     def test(self, test_step):
@@ -270,8 +352,9 @@ class RedirectToRouteValidator(StatusCodeRedirectValidator):
         super(RedirectToRouteValidator, self).test(test_step)
 
         location = self.step.response['Location']
-        # remove schema, query string and host from URL. Since query string need to be removed to properly resolve that url
-        location = urlunsplit(('', '', urlsplit(location).path, '', ''))
+        # only keep the path of the URL since schema, host and especially
+        # query string need to be removed to properly resolve that url
+        location = urlsplit(location).path
 
         try:
             redirected_to_route = resolve(location).view_name
@@ -283,10 +366,11 @@ class RedirectToRouteValidator(StatusCodeRedirectValidator):
         self.step.test.assertEqual(
             redirected_to_route,
             self.expected_route_name,
-            '{} returned redirect to route {} != {}'
-            ''.format(self._get_base_error_message(),
-                      redirected_to_route,
-                      self.expected_route_name)
+            self._get_error_message(
+                '{} returned redirect to route {} != {}',
+                redirected_to_route,
+                self.expected_route_name,
+            )
         )
 
 
@@ -298,7 +382,7 @@ class ResponseContentContainsValidator(StatusCodeOkValidator):
     :var str expected_content: Expected string in the
         server response
     """
-    expected_attrs = ('expected_content',)
+    expected_attrs = frozenset(('expected_content',))
     expected_content = None
 
     def test(self, test_step):
@@ -310,12 +394,13 @@ class ResponseContentContainsValidator(StatusCodeOkValidator):
         super(ResponseContentContainsValidator, self).test(test_step)
 
         self.step.test.assertIn(
-            self.expected_content,
-            # need to decode since content is binary
-            self.step.response.content.decode('utf-8'),
-            '{} does not contain {!r} in its content'
-            ''.format(self._get_base_error_message(),
-                      self.expected_content)
+            # compare bytes to avoid decoding binary content
+            self._get_content_bytes(self.expected_content),
+            self.step.response.content,
+            self._get_error_message(
+                '{} does not contain {!r} in its content',
+                self.expected_content,
+            )
         )
 
 
@@ -327,7 +412,7 @@ class ResponseContentNotContainsValidator(StatusCodeOkValidator):
     :var str unexpected_content: Unexpected string in the
         server response
     """
-    expected_attrs = ('unexpected_content',)
+    expected_attrs = frozenset(('unexpected_content',))
     unexpected_content = None
 
     def test(self, test_step):
@@ -339,12 +424,13 @@ class ResponseContentNotContainsValidator(StatusCodeOkValidator):
         super(ResponseContentNotContainsValidator, self).test(test_step)
 
         self.step.test.assertNotIn(
-            self.unexpected_content,
-            # need to decode since content is binary
-            self.step.response.content.decode('utf-8'),
-            'UnexpectedContentFound: {} contains {!r} in its content. '
-            ''.format(self._get_base_error_message(),
-                      self.unexpected_content)
+            # compare bytes to avoid decoding binary content
+            self._get_content_bytes(self.unexpected_content),
+            self.step.response.content,
+            self._get_error_message(
+                'UnexpectedContentFound: {} contains {!r} in its content. ',
+                self.unexpected_content,
+            )
         )
 
 
@@ -354,11 +440,12 @@ class SessionDataValidator(BaseValidator):
     session key.
 
     :var str expected_session_key: Expected session key to be present in session
-    :var list expected_session_secondary_keys: List of Expected session key to be present in session
+    :var tuple expected_session_secondary_keys: Expected secondary keys to be present
+        in the ``session[expected_session_key]`` dictionary
     """
-    expected_attrs = ('expected_session_key',)
+    expected_attrs = frozenset(('expected_session_key',))
     expected_session_key = None
-    expected_session_secondary_keys = []
+    expected_session_secondary_keys = ()
 
     def test(self, test_step):
         """
@@ -366,32 +453,51 @@ class SessionDataValidator(BaseValidator):
         ensure the expected session key data matches what is there currently.
         """
         super(SessionDataValidator, self).test(test_step)
-        self.step.test.assertIn(
-            self.expected_session_key,
-            self.step.response.wsgi_request.session.keys(),
-            '{} does not contain session[{!r}].'
-            ''.format(self._get_base_error_message(),
-                      self.expected_session_key)
+
+        test = self.step.test
+        session = self.step.response.wsgi_request.session
+        key = self.expected_session_key
+
+        test.assertIn(
+            key,
+            session,
+            self._get_error_message(
+                '{} does not contain session[{!r}].',
+                key,
+            )
         )
-        if self.expected_session_secondary_keys:
-            self.step.test.assertIsInstance(
-                self.step.response.wsgi_request.session[self.expected_session_key],
-                dict,
-                '{} session[{!r}] is not a dictionary hence cannot contain secondary keys.'
-                ''.format(self._get_base_error_message(), self.expected_session_key)
+
+        secondary_keys = self.expected_session_secondary_keys
+        if not secondary_keys:
+            return
+
+        data = session[key]
+        test.assertIsInstance(
+            data,
+            dict,
+            self._get_error_message(
+                '{} session[{!r}] is not a dictionary hence cannot contain secondary keys.',
+                key,
             )
+        )
         # Make sure secondary keys are not empty.
-        for secondary_key in self.expected_session_secondary_keys:
-            self.step.test.assertIn(
+        for secondary_key in secondary_keys:
+            test.assertIn(
                 secondary_key,
-                self.step.response.wsgi_request.session[self.expected_session_key].keys(),
-                '{} does not contain session[{!r}][{!r}].'
-                ''.format(self._get_base_error_message(), self.expected_session_key, secondary_key)
+                data,
+                self._get_error_message(
+                    '{} does not contain session[{!r}][{!r}].',
+                    key,
+                    secondary_key,
+                )
             )
-            self.step.test.assertIsNotNone(
-                self.step.response.wsgi_request.session[self.expected_session_key][secondary_key],
-                '{} contains session[{!r}][{!r}] but is empty.'
-                ''.format(self._get_base_error_message(), self.expected_session_key, secondary_key)
+            test.assertIsNotNone(
+                data[secondary_key],
+                self._get_error_message(
+                    '{} contains session[{!r}][{!r}] but is empty.',
+                    key,
+                    secondary_key,
+                )
             )
 
 
@@ -406,7 +512,7 @@ class FormInitialDataValidator(BaseValidator):
     :var bool test_initial_value_present: Test if the initial value key is present in initial data
     :var bool test_initial_value_not_none: Test if the initial value is not ``None``
     """
-    expected_attrs = ('initial_data_key',)
+    expected_attrs = frozenset(('initial_data_key',))
     initial_data_key = None
     expected_initial_data_value = None
     context_data_form_name = 'form'
@@ -418,62 +524,76 @@ class FormInitialDataValidator(BaseValidator):
     def test(self, test_step):
         super(FormInitialDataValidator, self).test(test_step)
 
-        self.step.test.assertIsInstance(
-            self.step.response,
+        test = self.step.test
+        response = self.step.response
+        form_name = self.context_data_form_name
+        key = self.initial_data_key
+
+        test.assertIsInstance(
+            response,
             SimpleTemplateResponse,
-            '{} did not return SimpleTemplateResponse '
-            'and as such response.context_data is not accessible. '
-            'It returned {!r}'
-            ''.format(self._get_base_error_message(),
-                      type(self.step.response))
+            self._get_error_message(
+                '{} did not return SimpleTemplateResponse '
+                'and as such response.context_data is not accessible. '
+                'It returned {!r}',
+                type(response),
+            )
         )
 
-        self.step.test.assertIn(
-            self.context_data_form_name,
-            self.step.response.context_data,
-            '{} did not render with {!r} in its context_data'
-            ''.format(self._get_base_error_message(),
-                      self.context_data_form_name)
+        context_data = response.context_data
+        test.assertIn(
+            form_name,
+            context_data,
+            self._get_error_message(
+                '{} did not render with {!r} in its context_data',
+                form_name,
+            )
         )
 
-        self.step.test.assertIsInstance(
-            self.step.response.context_data[self.context_data_form_name].initial,
+        initial = context_data[form_name].initial
+        test.assertIsInstance(
+            initial,
             dict,
-            '{} did not render with the context_data[{!r}].initial being a dictionary'
-            ''.format(self._get_base_error_message(),
-                      self.context_data_form_name)
+            self._get_error_message(
+                '{} did not render with the context_data[{!r}].initial being a dictionary',
+                form_name,
+            )
         )
 
         if self.test_initial_value_present:
-            self.step.test.assertIn(
-                self.initial_data_key,
-                self.step.response.context_data[self.context_data_form_name].initial.keys(),
-                '{} did not render with {!r} in the context_data[{!r}].initial. '
-                'Provided keys - {!r}'
-                ''.format(self._get_base_error_message(),
-                          self.initial_data_key,
-                          self.context_data_form_name,
-                          self.step.response.context_data[self.context_data_form_name].initial.keys())
+            test.assertIn(
+                key,
+                initial,
+                self._get_error_message(
+                    '{} did not render with {!r} in the context_data[{!r}].initial. '
+                    'Provided keys - {!r}',
+                    key,
+                    form_name,
+                    initial.keys(),
+                )
             )
 
         if self.test_initial_value_not_none:
-            self.step.test.assertIsNotNone(
-                self.step.response.context_data['form'].initial[self.initial_data_key],
-                '{} rendered with {!r} for context_data[{!r}].initial[{!r}]'
-                ''.format(self._get_base_error_message(),
-                          None,
-                          self.context_data_form_name,
-                          self.initial_data_key)
+            test.assertIsNotNone(
+                initial[key],
+                self._get_error_message(
+                    '{} rendered with {!r} for context_data[{!r}].initial[{!r}]',
+                    None,
+                    form_name,
+                    key,
+                )
             )
 
         if self.test_initial_value:
-            self.step.test.assertEqual(
-                self.step.response.context_data['form'].initial[self.initial_data_key],
+            value = initial[key]
+            test.assertEqual(
+                value,
                 self.expected_initial_data_value,
-                '{} rendered with context_data[{!r}].initial[{!r}] = {} != {}'
-                ''.format(self._get_base_error_message(),
-                          self.context_data_form_name,
-                          self.initial_data_key,
-                          self.step.response.context_data['form'].initial[self.initial_data_key],
-                          self.expected_initial_data_value)
+                self._get_error_message(
+                    '{} rendered with context_data[{!r}].initial[{!r}] = {} != {}',
+                    form_name,
+                    key,
+                    value,
+                    self.expected_initial_data_value,
+                )
             )
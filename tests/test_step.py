@@ -2,8 +2,13 @@ from __future__ import print_function, unicode_literals
 from collections import OrderedDict
 from unittest import TestCase
 
-import mock
+try:
+    from unittest import mock
+except ImportError:  # Python 2
+    import mock
+
 import six
+from django.core.exceptions import ImproperlyConfigured
 
 from subui.step import StatefulUrlParamsTestStep, TestStep
 
@@ -23,6 +28,14 @@ class TestTestStep(TestCase):
         self.assertTrue(hasattr(step, 'hello'))
         self.assertEqual(getattr(step, 'hello'), 'world')
 
+    def test__init__slots(self):
+        """
+        Test that __init__ stores runtime attributes in slots
+        """
+        step = TestStep(client=mock.sentinel.client)
+        self.assertEqual(step.client, mock.sentinel.client)
+        self.assertNotIn('client', step.__dict__)
+
     def test_init(self):
         """
         Test that init stores given parameters as attributes
@@ -40,6 +53,42 @@ class TestTestStep(TestCase):
         self.assertEqual(step.step_key, mock.sentinel.step_key)
         self.assertEqual(step.state, mock.sentinel.state)
 
+    def test_init_step_items(self):
+        """
+        Test that init uses given step items for
+        previous and next steps
+        """
+        steps = OrderedDict((
+            ('one', 1),
+            ('two', 2),
+        ))
+        step = TestStep()
+        step.init(mock.sentinel.client,
+                  steps,
+                  1,
+                  'two',
+                  mock.sentinel.state,
+                  step_items=[('one', 1), ('two', 2)])
+
+        self.assertEqual(step.prev_step, 1)
+        self.assertEqual(step.prev_steps, OrderedDict((('one', 1),)))
+
+    def test_init_skipped_hooks(self):
+        """
+        Test that init only skips hooks which are not overridden
+        """
+        class Step(TestStep):
+            def pre_request_hook(self):
+                pass
+
+        step = Step(post_test_response=mock.MagicMock())
+        step.init(None, None, 0, 0, None)
+
+        self.assertSetEqual(
+            set(step._skipped_hooks),
+            {'post_request_hook', 'pre_test_response'}
+        )
+
     def test_steps(self):
         """
         Test prev_steps, next_steps, prev_step and next_step
@@ -71,6 +120,32 @@ class TestTestStep(TestCase):
             4,
         )
 
+    def test_steps_boundaries(self):
+        """
+        Test that prev_step and next_step return None for the
+        first and last steps and that replacing steps
+        invalidates cached steps
+        """
+        step = TestStep()
+        step.steps = OrderedDict((
+            ('one', 1),
+            ('two', 2),
+        ))
+
+        step.step_index = 0
+        self.assertIsNone(step.prev_step)
+        self.assertEqual(step.next_steps, OrderedDict((('two', 2),)))
+
+        step.step_index = 1
+        self.assertIsNone(step.next_step)
+        self.assertEqual(step.prev_step, 1)
+
+        step.steps = OrderedDict((
+            ('three', 3),
+            ('four', 4),
+        ))
+        self.assertEqual(step.prev_step, 3)
+
     def test_get_content_type(self):
         """
         Test that get_content_type returns content_type if defined
@@ -188,6 +263,52 @@ class TestTestStep(TestCase):
         mock_pre_request_hook.assert_called_once_with(step)
         mock_post_response_hook.assert_called_once_with(step)
 
+    @mock.patch(TESTING_MODULE + '.override_settings')
+    @mock.patch.object(TestStep, 'get_url')
+    def test_request_override_settings(self, mock_get_url, mock_override_settings):
+        """
+        Test that settings are only overriden when
+        overriden_settings are defined
+        """
+        step = TestStep(client=mock.MagicMock())
+
+        step.request()
+        self.assertFalse(mock_override_settings.called)
+
+        step.overriden_settings = {'ROOT_URLCONF': 'services.urls'}
+        step.request()
+        mock_override_settings.assert_called_once_with(ROOT_URLCONF='services.urls')
+
+    @mock.patch.object(TestStep, 'get_url')
+    def test_request_method_set_in_hook(self, mock_get_url):
+        """
+        Test that request uses request_method set in pre_request_hook
+        """
+        class Step(TestStep):
+            def pre_request_hook(self):
+                self.request_method = 'get'
+
+        mock_client = mock.MagicMock()
+        mock_client.get.return_value = mock.sentinel.response
+
+        step = Step()
+        step.init(mock_client, None, 0, 0, None)
+
+        actual = step.request()
+
+        self.assertEqual(actual, mock.sentinel.response)
+        self.assertFalse(mock_client.post.called)
+
+    def test_send_request_unsupported_method(self):
+        """
+        Test that _send_request fails when the client
+        does not support the request_method
+        """
+        step = TestStep(client=mock.Mock(spec=['get']), request_method='post_json')
+
+        with self.assertRaises(ImproperlyConfigured):
+            step._send_request()
+
     @mock.patch.object(TestStep, 'get_url')
     def test_request_with_error(self, mock_get_url):
         """
@@ -209,20 +330,22 @@ class TestTestStep(TestCase):
             'Response for {foo:TestStep} requesting "sentinel.url" failed:'
         )
 
+        with self.assertRaises(Exception) as e2:
+            step.request()
+
+        self.assertIs(e2.exception.__class__, e.exception.__class__)
+
     @patch_class_method_with_original(TestStep, 'post_test_response')
     @patch_class_method_with_original(TestStep, 'pre_test_response')
-    @mock.patch('inspect.isclass')
     def test_test_response(self,
                            mock_pre_test_response,
-                           mock_post_test_response,
-                           mock_isclass):
+                           mock_post_test_response):
         """
         Test that test_response loops over all validators
         and correctly calls them
         """
-        mock_isclass.side_effect = [True, False]
         validator = mock.MagicMock()
-        class_validator = mock.MagicMock()
+        class_validator = mock.MagicMock(spec=type)
         step = TestStep(validators=[class_validator, validator])
         step.test_response()
 
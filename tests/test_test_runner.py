@@ -2,7 +2,11 @@ from __future__ import print_function, unicode_literals
 from collections import OrderedDict
 from unittest import TestCase
 
-import mock
+try:
+    from unittest import mock
+except ImportError:  # Python 2
+    import mock
+
 from pycontext.context import Context
 
 from subui.test_runner import SubUITestRunner
@@ -30,14 +34,25 @@ class TestSubUITestRunner(TestCase):
         with self.assertRaises(AssertionError):
             SubUITestRunner(steps=None, client=None)
 
-    @mock.patch('inspect.isclass')
-    def test_normalize_keys(self, mock_isclass):
+    @mock.patch.object(SubUITestRunner, '_normalize_steps')
+    def test_init_state_class(self, mock_normalize_steps):
+        """
+        Test that init uses state_class to construct the state
+        """
+        class Runner(SubUITestRunner):
+            state_class = dict
+
+        runner = Runner(steps=[], client=None, state={'hello': 'world'})
+
+        self.assertIs(type(runner.state), dict)
+        self.assertEqual(runner.state, {'hello': 'world'})
+
+    def test_normalize_keys(self):
         """
         Test that _normalize_steps converts steps to OrderedDict
         and instantiated each step if necessary
         """
-        mock_isclass.side_effect = True, False
-        step1 = mock.MagicMock()
+        step1 = mock.MagicMock(spec=type)
         step2 = mock.MagicMock()
 
         with mock.patch.object(SubUITestRunner, '_normalize_steps'):
@@ -59,6 +74,20 @@ class TestSubUITestRunner(TestCase):
             (1, step2),
         )))
 
+    def test_normalize_keys_instances(self):
+        """
+        Test that _normalize_steps keeps OrderedDict of
+        already instantiated steps as is
+        """
+        steps = OrderedDict((
+            ('one', mock.MagicMock()),
+            ('two', mock.MagicMock()),
+        ))
+
+        runner = SubUITestRunner(steps, None)
+
+        self.assertIs(runner.steps, steps)
+
     def test_run(self):
         """
         Test that run loops all steps and executes them
@@ -74,7 +103,7 @@ class TestSubUITestRunner(TestCase):
             steps=runner.steps,
             step_index=0,
             step_key=0,
-            state=runner.state
+            state=runner.state,
         )
         step.request.assert_called_once_with()
         step.test_response.assert_called_once_with()
@@ -1,7 +1,12 @@
 from __future__ import print_function, unicode_literals
 from unittest import TestCase
 
-import mock
+try:
+    from unittest import mock
+except ImportError:  # Python 2
+    import mock
+
+import six
 from django.core.exceptions import ImproperlyConfigured
 from django.core.urlresolvers import Resolver404
 from django.http.response import HttpResponse
@@ -20,9 +25,52 @@ from subui.validators import (
 
 
 TESTING_MODULE = 'subui.validators'
+ANY = mock.ANY
+_REDIRECT_URL = 'http://example.com/foo/bar/?query=here#fragment'
+
+_TEST_METHODS = (
+    'assertEqual',
+    'assertIn',
+    'assertIsInstance',
+    'assertIsNotNone',
+    'assertNotIn',
+    'fail',
+)
+
+
+def _fake_test():
+    """
+    Get mock of the test case with only the assertion
+    methods which validators use.
+    """
+    return mock.Mock(spec=_TEST_METHODS, unsafe=True)
+
+
+def _make_content_step():
+    """
+    Get test step with response content.
+    """
+    return mock.Mock(
+        response=mock.Mock(
+            content=b'abc',
+        ),
+        test=_fake_test(),
+    )
+
+
+# str() since type() does not accept unicode names in Python 2
+Validator1 = type(str('Validator1'), (BaseValidator,), {'expected_attrs': ('foo1',)})
+Validator2 = type(str('Validator2'), (Validator1,), {'expected_attrs': ('foo2',)})
+Validator3 = type(str('Validator3'), (Validator1,), {'expected_attrs': ('foo3',)})
+Validator4 = type(str('Validator4'), (Validator2, Validator3), {'expected_attrs': ('foo4',)})
 
 
 class TestBaseValidator(TestCase):
+    INIT_KWARGS = (
+        ('hello', 'world'),
+        ('foo', 'bar'),
+    )
+
     def setUp(self):
         class Validator(BaseValidator):
             pass
@@ -33,17 +81,13 @@ class TestBaseValidator(TestCase):
         """
         Test that __init__ properly stores given parameters
         """
-        mock_step = mock.MagicMock(test=mock.create_autospec(self))
-        kwargs = {
-            'hello': 'world',
-            'foo': 'bar',
-        }
+        mock_step = mock.Mock()
 
         self.validator_class.hello = 'mars'
-        validator = self.validator_class(mock_step, **kwargs)
+        validator = self.validator_class(mock_step, **dict(self.INIT_KWARGS))
 
         self.assertIs(validator.step, mock_step)
-        for key, value in kwargs.items():
+        for key, value in self.INIT_KWARGS:
             self.assertTrue(hasattr(validator, key))
             self.assertEqual(getattr(validator, key), value)
 
@@ -52,23 +96,28 @@ class TestBaseValidator(TestCase):
         Test that _get_expected_attrs returns expected attributes
         from all base classes.
         """
+        validator = Validator4()
 
-        class Validator(BaseValidator):
-            expected_attrs = ('foo1',)
-
-        class Validator2(Validator):
-            expected_attrs = ('foo2',)
+        self.assertSetEqual(set(validator._get_expected_attrs()),
+                            {'foo1', 'foo2', 'foo3', 'foo4'})
 
-        class Validator3(Validator):
-            expected_attrs = ('foo3',)
+    def test_get_expected_attrs_cached(self):
+        """
+        Test that _get_expected_attrs caches expected attributes
+        per class without leaking them to subclasses.
+        """
+        self.validator_class.expected_attrs = ('foo',)
 
-        class Validator4(Validator2, Validator3):
-            expected_attrs = ('foo4',)
+        class Validator(self.validator_class):
+            expected_attrs = ('bar',)
 
-        validator = Validator4()
+        attrs = self.validator_class()._get_expected_attrs()
+        self.assertEqual(attrs, ['foo'])
+        self.assertIn('_resolved_expected_attrs', self.validator_class.__dict__)
+        self.assertEqual(Validator()._get_expected_attrs(), ['bar', 'foo'])
 
-        self.assertSetEqual(set(validator._get_expected_attrs()),
-                            {'foo1', 'foo2', 'foo3', 'foo4'})
+        attrs.remove('foo')
+        self.assertEqual(self.validator_class()._get_expected_attrs(), ['foo'])
 
     def test_check_importper_configuration(self):
         """
@@ -84,7 +133,40 @@ class TestBaseValidator(TestCase):
         validator.foo = 'bar'
         validator._check_improper_configuration()
 
-        self.assertTrue(True)
+    def test_get_error_message(self):
+        """
+        Test that _get_error_message is only formatted
+        when rendered as string for the step it was created for
+        """
+        mock_step = mock.Mock(step_key='foo')
+        mock_step.get_url.return_value = '/foo/'
+        validator = self.validator_class(mock_step)
+
+        msg = validator._get_error_message('{} returned {!r}', 'foo')
+
+        self.assertFalse(mock_step.get_url.called)
+
+        validator.step = mock.Mock(step_key='bar')
+        self.assertEqual(six.text_type(msg),
+                         'Response for {{foo:Mock}} requesting "/foo/" '
+                         'returned {!r}'.format('foo'))
+
+    @mock.patch(TESTING_MODULE + '.force_bytes')
+    def test_get_content_bytes(self, mock_force_bytes):
+        """
+        Test that _get_content_bytes only encodes content
+        again when it changes
+        """
+        validator = self.validator_class()
+
+        actual = validator._get_content_bytes('foo')
+        validator._get_content_bytes('foo')
+
+        self.assertEqual(actual, mock_force_bytes.return_value)
+        mock_force_bytes.assert_called_once_with('foo')
+
+        validator._get_content_bytes('bar')
+        mock_force_bytes.assert_called_with('bar')
 
     @mock.patch.object(BaseValidator, '_check_improper_configuration')
     def test_test(self, mock_check_improper_configuration):
@@ -93,7 +175,7 @@ class TestBaseValidator(TestCase):
         _check_improper_configuration
         """
         validator = self.validator_class()
-        mock_step = mock.MagicMock(test=mock.create_autospec(self))
+        mock_step = mock.Mock(test=_fake_test())
 
         validator.test(mock_step)
 
@@ -117,50 +199,69 @@ class TestHeaderValidator(TestCase):
         self.assertSetEqual(set(self.validator._get_expected_attrs()),
                             {'header_name'})
 
-    def test_test(self):
+    def _make_step(self):
         """
-        Test that expected header is present in the response
-        and its value is validated when test_header_value is True
+        Configure the validator and get test step
+        with the response containing expected header
         """
-        self.validator.test_header_value = False
         self.validator.header_name = 'header-name'
         self.validator.expected_header = 'some-value'
 
-        self.validator.step = mock_step = mock.Mock(test=mock.create_autospec(self))
-        self.validator.step.response = {'header-name': 'header-name'}
-        self.validator.step.test = mock.Mock(unsafe=True)
+        return mock.Mock(
+            response={'header-name': 'header-name'},
+            test=_fake_test(),
+        )
+
+    def test_header_name_only(self):
+        """
+        Test that only presence of the header is validated
+        when test_header_value is False
+        """
+        mock_step = self._make_step()
+        self.validator.test_header_value = False
 
         self.validator.test(mock_step)
 
         mock_step.test.assertIn.assert_called_once_with(
             'header-name',
             mock_step.response,
-            mock.ANY
+            ANY
         )
         self.assertFalse(mock_step.test.assertEqual.called)
 
+    def test_header_value_enabled(self):
+        """
+        Test that header value is validated when test_header_value is True
+        """
+        mock_step = self._make_step()
         self.validator.test_header_value = True
-        mock_step.test.reset_mock()
+
         self.validator.test(mock_step)
 
         mock_step.test.assertEqual.assert_called_once_with(
             mock_step.response['header-name'],
             'some-value',
-            mock.ANY
+            ANY
         )
 
+    def test_contains_value_enabled(self):
+        """
+        Test that header value is validated to contain expected header
+        when test_contains_value is True
+        """
+        mock_step = self._make_step()
         self.validator.test_contains_value = True
-        mock_step.test.reset_mock()
+
         self.validator.test(mock_step)
 
-        self.assertFalse(self.validator.test_header_value)
+        self.assertTrue(self.validator.test_header_value)
         mock_step.test.assertIn.assert_has_calls([
             mock.call('header-name',
                       mock_step.response,
-                      mock.ANY),
+                      ANY),
             mock.call('some-value',
                       mock_step.response['header-name'],
-                      mock.ANY)
+                      ANY)
         ])
         self.assertFalse(mock_step.test.assertEqual.called)
 
@@ -175,70 +276,78 @@ class TestStatusCodeValidator(TestCase):
         """
         self.validator.expected_status_code = 200
 
-        mock_step = mock.MagicMock(test=mock.create_autospec(self))
-        mock_step.test = mock.Mock(unsafe=True)
+        mock_step = mock.Mock(test=_fake_test())
 
         self.validator.test(mock_step)
 
         mock_step.test.assertEqual.assert_called_once_with(
             mock_step.response.status_code,
             200,
-            mock.ANY
+            ANY
         )
 
 
 class TestRedirectToRouteValidator(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        super(TestRedirectToRouteValidator, cls).setUpClass()
+        cls.response = HttpResponse('', status=302)
+        cls.response['Location'] = _REDIRECT_URL
+
+        cls.resolve_patcher = mock.patch(TESTING_MODULE + '.resolve')
+        cls.mock_resolve = cls.resolve_patcher.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.resolve_patcher.stop()
+        super(TestRedirectToRouteValidator, cls).tearDownClass()
+
     def setUp(self):
         self.validator = RedirectToRouteValidator()
+        self.mock_resolve.reset_mock(return_value=True, side_effect=True)
 
-    @mock.patch(TESTING_MODULE + '.resolve')
-    def test_test(self, mock_resolve):
+    def test_test(self):
         """
         Check that test verified that the response redirects
         to a particular route name
         """
         self.validator.expected_route_name = 'some-route'
-        response = HttpResponse('', status=302)
-        response['Location'] = 'http://example.com/foo/bar/?query=here#fragment'
 
-        mock_step = mock.MagicMock(
-            test=mock.create_autospec(self),
-            response=response,
+        mock_step = mock.Mock(
+            test=_fake_test(),
+            response=self.response,
         )
-        mock_resolve.return_value.view_name = 'view-name'
+        self.mock_resolve.return_value.view_name = 'view-name'
 
         self.validator.test(mock_step)
 
         mock_step.test.assertEqual.assert_any_call(
             'view-name',
             'some-route',
-            mock.ANY
+            ANY
         )
-        mock_resolve.assert_called_once_with('/foo/bar/')
+        self.mock_resolve.assert_called_once_with('/foo/bar/')
 
-    @mock.patch(TESTING_MODULE + '.resolve')
-    def test_test_invalid(self, mock_resolve):
+    def test_test_invalid(self):
         """
         Check that test verified that the response redirects
         to a particular route name when the redirect path
         cannot be resolved by Django
         """
         self.validator.expected_route_name = 'some-route'
-        response = HttpResponse('', status=302)
-        response['Location'] = 'http://example.com/foo/bar/?query=here#fragment'
 
-        mock_step = mock.MagicMock(
-            test=mock.create_autospec(self),
-            response=response,
+        mock_step = mock.Mock(
+            test=_fake_test(),
+            response=self.response,
         )
-        mock_resolve.side_effect = Resolver404
+        self.mock_resolve.side_effect = Resolver404
         mock_step.test.fail.side_effect = RuntimeError
 
         with self.assertRaises(RuntimeError):
             self.validator.test(mock_step)
 
-        mock_step.test.fail.assert_called_once_with(mock.ANY)
-        mock_resolve.assert_called_once_with('/foo/bar/')
+        mock_step.test.fail.assert_called_once_with(ANY)
+        self.mock_resolve.assert_called_once_with('/foo/bar/')
 
 
 class TestResponseContentContainsValidator(TestCase):
@@ -248,19 +357,14 @@ class TestResponseContentContainsValidator(TestCase):
     def test_test(self):
         self.validator.expected_content = 'some content'
 
-        mock_step = mock.MagicMock(
-            response=mock.MagicMock(
-                content=b'abc',
-            ),
-            test=mock.create_autospec(self),
-        )
+        mock_step = _make_content_step()
 
         self.validator.test(mock_step)
 
         mock_step.test.assertIn.assert_any_call(
-            'some content',
-            'abc',
-            mock.ANY
+            b'some content',
+            b'abc',
+            ANY
         )
 
 
@@ -271,19 +375,14 @@ class TestResponseContentNotContainsValidator(TestCase):
     def test_test(self):
         self.validator.unexpected_content = 'some content'
 
-        mock_step = mock.MagicMock(
-            response=mock.MagicMock(
-                content=b'abc',
-            ),
-            test=mock.create_autospec(self),
-        )
+        mock_step = _make_content_step()
 
         self.validator.test(mock_step)
 
         mock_step.test.assertNotIn.assert_any_call(
-            'some content',
-            'abc',
-            mock.ANY
+            b'some content',
+            b'abc',
+            ANY
         )
 
 
@@ -294,10 +393,11 @@ class TestSessionDataValidator(TestCase):
     def test_test(self):
         self.validator.expected_session_key = 'foo'
         self.validator.expected_session_secondary_keys = ['bar']
+        secondary_session = {
+            'bar': 'value',
+        }
         session = {
-            'foo': {
-                'bar': 'value',
-            },
+            'foo': secondary_session,
         }
 
         mock_step = mock.Mock(
@@ -306,27 +406,27 @@ class TestSessionDataValidator(TestCase):
                     session=session,
                 ),
             ),
-            test=mock.create_autospec(self),
+            test=_fake_test(),
         )
 
         self.validator.test(mock_step)
 
         mock_step.test.assertIn.assert_has_calls([
             mock.call('foo',
-                      session.keys(),
-                      mock.ANY),
+                      session,
+                      ANY),
             mock.call('bar',
-                      session['foo'].keys(),
-                      mock.ANY)
+                      secondary_session,
+                      ANY)
         ])
         mock_step.test.assertIsInstance.assert_called_once_with(
-            session['foo'],
+            secondary_session,
             dict,
-            mock.ANY
+            ANY
         )
         mock_step.test.assertIsNotNone.assert_called_once_with(
-            session['foo']['bar'],
-            mock.ANY
+            secondary_session['bar'],
+            ANY
         )
 
 
@@ -351,7 +451,7 @@ class TestFormInitialDataValidator(TestCase):
                     )
                 }
             ),
-            test=mock.create_autospec(self),
+            test=_fake_test(),
         )
 
         self.validator.test(mock_step)
@@ -359,25 +459,59 @@ class TestFormInitialDataValidator(TestCase):
         mock_step.test.assertIsInstance.assert_has_calls([
             mock.call(mock_step.response,
                       SimpleTemplateResponse,
-                      mock.ANY),
+                      ANY),
             mock.call(initial,
                       dict,
-                      mock.ANY, )
+                      ANY, )
         ])
         mock_step.test.assertIn.assert_has_calls([
             mock.call('form',
                       mock_step.response.context_data,
-                      mock.ANY),
+                      ANY),
             mock.call('foo',
-                      initial.keys(),
-                      mock.ANY),
+                      initial,
+                      ANY),
         ])
         mock_step.test.assertIsNotNone.assert_called_once_with(
             'value',
-            mock.ANY,
+            ANY,
+        )
+        mock_step.test.assertEqual.assert_called_once_with(
+            'value',
+            'bar',
+            ANY,
+        )
+
+    def test_test_context_data_form_name(self):
+        """
+        Test that initial data is validated on the form
+        defined by context_data_form_name
+        """
+        self.validator.test_initial_value = True
+        self.validator.initial_data_key = 'foo'
+        self.validator.expected_initial_data_value = 'bar'
+        self.validator.context_data_form_name = 'other_form'
+
+        mock_step = mock.Mock(
+            response=mock.Mock(
+                spec=SimpleTemplateResponse,
+                context_data={
+                    'other_form': mock.Mock(
+                        initial={'foo': 'value'},
+                    )
+                }
+            ),
+            test=_fake_test(),
+        )
+
+        self.validator.test(mock_step)
+
+        mock_step.test.assertIsNotNone.assert_called_once_with(
+            'value',
+            ANY,
         )
         mock_step.test.assertEqual.assert_called_once_with(
             'value',
             'bar',
-            mock.ANY,
+            ANY,
         )
@@ -2,7 +2,10 @@
 from __future__ import absolute_import, print_function, unicode_literals
 from functools import wraps
 
-import mock
+try:
+    from unittest import mock
+except ImportError:  # Python 2
+    import mock
 
 
 def patch_class_method_with_original(cls, method_name):
@@ -25,7 +28,7 @@ def patch_class_method_with_original(cls, method_name):
             foo = Foo()
             actual = foo.a()
             self.assertEqual(actual, 246)
-            mock_b.assert_called_once_with(123)
+            mock_b.assert_called_once_with(foo, 123)
 
     """
     original_mock = getattr(cls, method_name)
@@ -33,8 +36,14 @@ def patch_class_method_with_original(cls, method_name):
     def outer_wrapper(f):
         @wraps(f)
         def wrapper(*args, **kwargs):
-            with mock.patch.object(cls, method_name, autospec=True) as mocked:
-                mocked.side_effect = original_mock
+            mocked = mock.Mock(wraps=original_mock)
+
+            # plain function so that it is still bound to the instance
+            # hence mocked is called with self as first argument
+            def method(*method_args, **method_kwargs):
+                return mocked(*method_args, **method_kwargs)
+
+            with mock.patch.object(cls, method_name, new=method):
                 new_args = args + (mocked,)
                 return f(*new_args, **kwargs)
 